@@ -1 +0,0 @@
-# Empty file to make src a package
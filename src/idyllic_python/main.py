@@ -1,29 +1,41 @@
 """Main application module for the Idyllic Python Litestar app."""
 
-from typing import Any, Dict
+import asyncio
+import functools
+import sys
+from typing import Dict
 
-from litestar import Litestar, get, post
+import msgspec
+from litestar import Litestar, MediaType, Response, get, post
 from litestar.di import Provide
 from litestar.exceptions import NotFoundException
+from litestar.openapi import ResponseSpec
 from litestar.status_codes import HTTP_200_OK, HTTP_201_CREATED
-from pydantic import BaseModel
 
+from idyllic_python.storage import UserStorage
 
-class HealthResponse(BaseModel):
+
+class HealthResponse(msgspec.Struct, frozen=True):
     """Health check response model."""
 
     status: str
     message: str
 
 
-class UserCreateRequest(BaseModel):
+class MessageResponse(msgspec.Struct):
+    """Message response model."""
+
+    message: str
+
+
+class UserCreateRequest(msgspec.Struct):
     """User creation request model."""
 
     name: str
     email: str
 
 
-class UserResponse(BaseModel):
+class UserResponse(msgspec.Struct):
     """User response model."""
 
     id: int
@@ -31,118 +43,142 @@ class UserResponse(BaseModel):
     email: str
 
 
-# In-memory storage for demo purposes
-class UserStorage:
-    """Simple in-memory user storage."""
-
-    def __init__(self) -> None:
-        self.users_db: Dict[int, Dict[str, Any]] = {}
-        self.next_user_id = 1
+class UsersEnvelope(msgspec.Struct):
+    """Users list response model."""
 
-    def get_all_users(self) -> list[Dict[str, Any]]:
-        """Get all users."""
-        return list(self.users_db.values())
+    users: list[UserResponse]
 
-    def get_user(self, user_id: int) -> Dict[str, Any] | None:
-        """Get a user by ID."""
-        return self.users_db.get(user_id)
 
-    def create_user(self, name: str, email: str) -> Dict[str, Any]:
-        """Create a new user."""
-        user_data = {
-            "id": self.next_user_id,
-            "name": name,
-            "email": email,
-        }
-        self.users_db[self.next_user_id] = user_data
-        self.next_user_id += 1
-        return user_data
+# Process-wide storage, bound once at import time
+_USER_STORAGE = UserStorage()
 
 
 class UserStorageProvider:
-    """Singleton provider for UserStorage."""
+    """Lifecycle helpers for the UserStorage singleton."""
 
-    _instance: UserStorage | None = None
-
-    @classmethod
-    def get_instance(cls) -> UserStorage:
-        """Get the singleton UserStorage instance."""
-        if cls._instance is None:
-            cls._instance = UserStorage()
-        return cls._instance
+    __slots__ = ()
 
     @classmethod
     def reset_instance(cls) -> None:
         """Reset the singleton instance (useful for testing)."""
-        cls._instance = None
+        _USER_STORAGE.clear()
 
 
 def get_user_storage() -> UserStorage:
     """Dependency provider for UserStorage."""
-    return UserStorageProvider.get_instance()
+    return _USER_STORAGE
+
+
+def enable_eager_tasks() -> None:
+    """Startup hook enabling eager task execution on the running event loop."""
+    if sys.version_info >= (3, 12):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+
+# Static responses are built once at import time rather than per request
+_HEALTH = HealthResponse(status="healthy", message="Service is running")
+_ROOT = {"message": "Welcome to Idyllic Python API!"}
 
 
 @get("/health", status_code=HTTP_200_OK)
 async def health_check() -> HealthResponse:
     """Health check endpoint."""
-    return HealthResponse(status="healthy", message="Service is running")
+    return _HEALTH
 
 
 @get("/")
 async def root() -> Dict[str, str]:
     """Root endpoint with welcome message."""
-    return {"message": "Welcome to Idyllic Python API!"}
+    return _ROOT
+
+
+_HELLO_PREFIX = b'{"message":"Hello, '
+_HELLO_SUFFIX = b'!"}'
+
+
+@functools.lru_cache(maxsize=256)
+def _hello_body(name: str) -> bytes:
+    """Build the encoded greeting for a name, caching recently seen names."""
+    # Encoding the name as a JSON string escapes it, the quotes are stripped
+    escaped_name = msgspec.json.encode(name)[1:-1]
+    return _HELLO_PREFIX + escaped_name + _HELLO_SUFFIX
 
 
-@get("/hello/{name:str}")
-async def hello_name(name: str) -> Dict[str, str]:
+@get(
+    "/hello/{name:str}",
+    responses={HTTP_200_OK: ResponseSpec(data_container=MessageResponse)},
+)
+async def hello_name(name: str) -> Response[bytes]:
     """Personalized greeting endpoint."""
-    return {"message": f"Hello, {name}!"}
+    return Response(content=_hello_body(name), media_type=MediaType.JSON)
 
 
-@get("/users")
-async def get_users(user_storage: UserStorage) -> Dict[str, Any]:
+_USERS_PREFIX = b'{"users":'
+_USERS_SUFFIX = b"}"
+
+
+@get(
+    "/users",
+    responses={HTTP_200_OK: ResponseSpec(data_container=UsersEnvelope)},
+)
+async def get_users(user_storage: UserStorage) -> Response[bytes]:
     """Get all users."""
-    return {"users": user_storage.get_all_users()}
+    return Response(
+        content=_USERS_PREFIX + user_storage.get_all_users_json() + _USERS_SUFFIX,
+        media_type=MediaType.JSON,
+    )
 
 
-@get("/users/{user_id:int}")
-async def get_user(user_id: int, user_storage: UserStorage) -> UserResponse:
+@get(
+    "/users/{user_id:int}",
+    responses={HTTP_200_OK: ResponseSpec(data_container=UserResponse)},
+)
+async def get_user(user_id: int, user_storage: UserStorage) -> Response[bytes]:
     """Get a specific user by ID."""
-    user_data = user_storage.get_user(user_id)
-    if user_data is None:
+    user_json = user_storage.get_user_json(user_id)
+    if user_json is None:
         raise NotFoundException(detail=f"User with ID {user_id} not found")
 
-    return UserResponse(**user_data)
+    return Response(content=user_json, media_type=MediaType.JSON)
 
 
-@post("/users", status_code=HTTP_201_CREATED)
+@post(
+    "/users",
+    status_code=HTTP_201_CREATED,
+    responses={HTTP_201_CREATED: ResponseSpec(data_container=UserResponse)},
+)
 async def create_user(
     data: UserCreateRequest, user_storage: UserStorage
-) -> UserResponse:
+) -> Response[bytes]:
     """Create a new user."""
-    user_data = user_storage.create_user(data.name, data.email)
+    user_json = user_storage.create_user(data.name, data.email)
 
-    return UserResponse(
-        id=user_data["id"],
-        name=user_data["name"],
-        email=user_data["email"],
+    return Response(
+        content=user_json, status_code=HTTP_201_CREATED, media_type=MediaType.JSON
     )
 
 
+_ROUTE_HANDLERS = (
+    health_check,
+    root,
+    hello_name,
+    get_users,
+    get_user,
+    create_user,
+)
+
+
 def create_app() -> Litestar:
     """Create and configure the Litestar application."""
 
     return Litestar(
-        route_handlers=[
-            health_check,
-            root,
-            hello_name,
-            get_users,
-            get_user,
-            create_user,
-        ],
-        dependencies={"user_storage": Provide(get_user_storage, sync_to_thread=False)},
+        route_handlers=_ROUTE_HANDLERS,
+        dependencies={
+            "user_storage": Provide(
+                get_user_storage, sync_to_thread=False, use_cache=True
+            )
+        },
+        on_startup=[enable_eager_tasks],
         debug=True,
     )
 
@@ -154,4 +190,4 @@ app = create_app()
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    uvicorn.run("idyllic_python.main:app", host="0.0.0.0", port=8000, reload=True)
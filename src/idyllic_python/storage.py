@@ -0,0 +1,39 @@
+"""In-memory user storage for the Idyllic Python Litestar app."""
+
+import msgspec
+
+
+class UserStorage:
+    """Simple in-memory user storage.
+
+    Users are only ever read back as JSON, so each user is stored once as
+    its encoded bytes. User IDs are dense and start at 1, so the bytes are
+    kept in a list indexed by ``user_id - 1`` rather than a dict.
+    """
+
+    __slots__ = ("_encoded",)
+
+    def __init__(self) -> None:
+        self._encoded: list[bytes] = []
+
+    def get_all_users_json(self) -> bytes:
+        """Get all users as a pre-encoded JSON array."""
+        return b"[" + b",".join(self._encoded) + b"]"
+
+    def get_user_json(self, user_id: int) -> bytes | None:
+        """Get a user by ID as pre-encoded JSON."""
+        if not 1 <= user_id <= len(self._encoded):
+            return None
+        return self._encoded[user_id - 1]
+
+    def create_user(self, name: str, email: str) -> bytes:
+        """Create a new user and return it as pre-encoded JSON."""
+        user_json = msgspec.json.encode(
+            {"id": len(self._encoded) + 1, "name": name, "email": email}
+        )
+        self._encoded.append(user_json)
+        return user_json
+
+    def clear(self) -> None:
+        """Remove all users."""
+        self._encoded.clear()
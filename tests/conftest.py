@@ -3,24 +3,29 @@
 import pytest
 from litestar.testing import TestClient
 
-from idyllic_python.main import UserStorageProvider, create_app
+from idyllic_python.main import UserStorageProvider
+from idyllic_python.main import app as main_app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app():
-    """Create a fresh app instance for testing."""
-    # Clear the singleton instance before each test
-    UserStorageProvider.reset_instance()
-    return create_app()
+    """Provide the module-level app instance shared by the test session."""
+    return main_app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client(app):  # pylint: disable=redefined-outer-name
-    """Create a test client for the app."""
+    """Create a test client shared by the test session."""
     with TestClient(app=app) as test_client:
         yield test_client
 
 
+@pytest.fixture(autouse=True)
+def reset_user_storage():
+    """Clear the user storage before each test."""
+    UserStorageProvider.reset_instance()
+
+
 @pytest.fixture
 def sample_user_data():
     """Sample user data for testing."""
@@ -1,5 +1,9 @@
 """Integration tests for the application."""
 
+import asyncio
+import sys
+
+import pytest
 from litestar.testing import TestClient
 
 
@@ -83,6 +87,19 @@ class TestAppConfiguration:
         """Test that debug mode is enabled in the test app."""
         assert app.debug is True
 
+    @pytest.mark.skipif(
+        sys.version_info < (3, 12), reason="eager_task_factory requires 3.12+"
+    )
+    def test_eager_task_factory_installed(self, client: TestClient):
+        """Test that startup installs the eager task factory on the app's loop."""
+
+        async def get_task_factory():
+            return asyncio.get_running_loop().get_task_factory()
+
+        task_factory = client.blocking_portal.call(get_task_factory)
+
+        assert task_factory is asyncio.eager_task_factory
+
     def test_route_handlers_registered(self, app):
         """Test that all expected route handlers are registered."""
         # Get all registered routes from the app's routes
@@ -100,3 +117,26 @@ class TestAppConfiguration:
             assert (
                 route_found
             ), f"Route {expected_route} not found in registered routes: {routes}"
+
+    def test_pre_encoded_response_schemas_documented(self, app):
+        """Test that pre-encoded responses still document their models."""
+        paths = app.openapi_schema.to_schema()["paths"]
+
+        hello_schema = paths["/hello/{name}"]["get"]["responses"]["200"]["content"]
+        assert hello_schema["application/json"]["schema"] == {
+            "$ref": "#/components/schemas/MessageResponse"
+        }
+
+        users_schema = paths["/users"]["get"]["responses"]["200"]["content"]
+        user_schema = paths["/users/{user_id}"]["get"]["responses"]["200"]["content"]
+        assert users_schema["application/json"]["schema"] == {
+            "$ref": "#/components/schemas/UsersEnvelope"
+        }
+        assert user_schema["application/json"]["schema"] == {
+            "$ref": "#/components/schemas/UserResponse"
+        }
+
+        created_schema = paths["/users"]["post"]["responses"]["201"]["content"]
+        assert created_schema["application/json"]["schema"] == {
+            "$ref": "#/components/schemas/UserResponse"
+        }
@@ -79,6 +79,15 @@ class TestHelloEndpoint:
         data = response.json()
         assert data["message"] == f"Hello, {name}!"
 
+    def test_hello_with_json_characters_in_name(self, client: TestClient):
+        """Test hello endpoint escapes characters that are special in JSON."""
+        name = 'Bobby "Tables" \\'
+        response = client.get(f"/hello/{name}")
+
+        assert response.status_code == HTTP_200_OK
+        data = response.json()
+        assert data["message"] == f"Hello, {name}!"
+
 
 class TestUserEndpoints:
     """Tests for user-related endpoints."""
@@ -134,6 +143,16 @@ class TestUserEndpoints:
 
         assert response.status_code == HTTP_404_NOT_FOUND
 
+    def test_get_user_by_out_of_range_id_not_found(
+        self, client: TestClient, sample_user_data
+    ):
+        """Test that zero and negative IDs do not resolve to stored users."""
+        client.post("/users", json=sample_user_data)
+
+        for user_id in (0, -1):
+            response = client.get(f"/users/{user_id}")
+            assert response.status_code == HTTP_404_NOT_FOUND
+
     def test_get_users_after_creation(self, client: TestClient, sample_user_data):
         """Test that created users appear in the users list."""
         # Initially empty